@@ -0,0 +1,156 @@
+import logging
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+class AnswerEngine:
+    """Precomputed answer checking and hint lookups for a single puzzle.
+
+    Built once when the puzzle is loaded and shared by every game session
+    playing that puzzle, so checks and hints don't re-derive anything per call.
+    """
+
+    MAX_HINT_LEVEL = 3
+
+    def __init__(self, puzzle):
+        self.title = puzzle.get("title")
+        self.clues = {}
+        self.answer_keys = {}
+        self.answer_index = {}
+        self.near_miss_costs = {}
+        self.crossings = {}
+        self.hint_ladders = {}
+
+        for clue in puzzle.get("clues", []):
+            clue_id = clue["id"]
+            key = self.normalize(clue["answer"])
+            self.clues[clue_id] = clue
+            self.answer_keys[clue_id] = key
+            self.answer_index.setdefault(key, []).append(clue_id)
+            # Allow one typo on short words, two on longer ones
+            self.near_miss_costs[clue_id] = 1 if len(key) <= 5 else 2
+
+        self._build_crossings()
+        for clue_id in self.clues:
+            self.hint_ladders[clue_id] = self._build_hint_ladder(clue_id)
+
+    @staticmethod
+    def normalize(answer):
+        """Normalize an answer for comparison: strip accents, spaces and punctuation"""
+        decomposed = unicodedata.normalize("NFKD", answer or "")
+        return "".join(ch for ch in decomposed if ch.isalnum() and not unicodedata.combining(ch)).upper()
+
+    def _clue_cells(self, clue):
+        """Grid cells covered by a clue's answer, in answer order"""
+        if "position" not in clue or "direction" not in clue:
+            return []
+        start_row, start_col = clue["position"]
+        if clue["direction"] == "across":
+            return [(start_row, start_col + i) for i in range(len(clue["answer"]))]
+        return [(start_row + i, start_col) for i in range(len(clue["answer"]))]
+
+    def _build_crossings(self):
+        """Map each clue to the letter indices revealed by each crossing clue
+
+        Only cells where both answers agree on the letter count as a crossing;
+        anywhere else the board shows whichever answer was written last, so
+        revealing the hinted answer's letter there would contradict it.
+        """
+        cell_owners = {}
+        for clue_id, clue in self.clues.items():
+            self.crossings[clue_id] = {}
+            for index, cell in enumerate(self._clue_cells(clue)):
+                cell_owners.setdefault(cell, []).append((clue_id, index))
+
+        for cell, owners in cell_owners.items():
+            for clue_id, index in owners:
+                letter = self.clues[clue_id]["answer"][index].upper()
+                for other_id, other_index in owners:
+                    if other_id == clue_id:
+                        continue
+                    other_letter = self.clues[other_id]["answer"][other_index].upper()
+                    if letter == other_letter:
+                        self.crossings[clue_id].setdefault(other_id, []).append(index)
+                    elif clue_id < other_id:
+                        logger.warning(
+                            f"Puzzle '{self.title}': clues {clue_id} and {other_id} disagree at cell {cell} "
+                            f"({letter} vs {other_letter})"
+                        )
+
+    def _build_hint_ladder(self, clue_id):
+        """Precompute the progressive hints for a clue
+
+        Each rung adds information: the first letters, then the letter count,
+        then a pattern that also reveals the last letter and any letters shown
+        by answered crossing clues. The last letter is held back when it
+        would be the only one left hidden, so no rung gives the answer away.
+        """
+        answer = self.clues[clue_id]["answer"].upper()
+        prefix = answer[:2] if len(answer) > 2 else answer[0]
+        base_revealed = set(range(len(prefix)))
+        if len(answer) - len(prefix) > 1:
+            base_revealed.add(len(answer) - 1)
+        return {
+            "first_letters": prefix + "...",
+            "letter_count": f"{prefix}... ({len(answer)} letters)",
+            "base_revealed": frozenset(base_revealed),
+        }
+
+    def get_clue(self, clue_id):
+        return self.clues.get(clue_id)
+
+    def check_answer(self, clue_id, answer):
+        """Check an answer, returning (correct, near_miss)"""
+        key = self.normalize(answer)
+        if clue_id in self.answer_index.get(key, ()):
+            return True, False
+        expected = self.answer_keys.get(clue_id)
+        if not expected or not key:
+            return False, False
+        return False, self._within_distance(key, expected, self.near_miss_costs[clue_id])
+
+    @staticmethod
+    def _within_distance(source, target, max_cost):
+        """Edit distance check that bails out once max_cost is exceeded
+
+        Uses optimal string alignment, so swapping two adjacent letters costs
+        one edit like any other typo.
+        """
+        if abs(len(source) - len(target)) > max_cost:
+            return False
+        before_previous = None
+        previous = list(range(len(target) + 1))
+        for i, source_char in enumerate(source, 1):
+            current = [i]
+            for j, target_char in enumerate(target, 1):
+                cost = min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (source_char != target_char),
+                )
+                if (i > 1 and j > 1 and source_char == target[j - 2]
+                        and source[i - 2] == target_char):
+                    cost = min(cost, before_previous[j - 2] + 1)
+                current.append(cost)
+            if min(current) > max_cost:
+                return False
+            before_previous, previous = previous, current
+        return previous[-1] <= max_cost
+
+    def get_hint(self, clue_id, level, answered_clues=()):
+        """Get the hint at a ladder level, revealing letters from answered crossings"""
+        ladder = self.hint_ladders.get(clue_id)
+        if not ladder:
+            return None
+        level = max(1, min(level, self.MAX_HINT_LEVEL))
+        if level == 1:
+            return ladder["first_letters"]
+        if level == 2:
+            return ladder["letter_count"]
+
+        answer = self.clues[clue_id]["answer"].upper()
+        revealed = set(ladder["base_revealed"])
+        for other_id, indices in self.crossings[clue_id].items():
+            if other_id in answered_clues:
+                revealed.update(indices)
+        return "".join(letter if i in revealed else "_" for i, letter in enumerate(answer))
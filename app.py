@@ -64,6 +64,7 @@ class GameSession:
         self.ai_score = 0
         self.turn = "player"
         self.current_puzzle = None
+        self.answer_engine = None
         self.answered_clues = []
         self.game_started = False
         self.game_ended = False
@@ -71,10 +72,12 @@ class GameSession:
         self.start_time = None
         self.grid_state = {}
         self.hints_used = 0
+        self.hint_levels = {}
         self.streak = 0
         
     def start_game(self):
         self.current_puzzle = puzzle_manager.get_puzzle(self.difficulty)
+        self.answer_engine = puzzle_manager.get_answer_engine(self.current_puzzle)
         self.game_started = True
         self.start_time = datetime.now()
         if self.current_puzzle:
@@ -84,18 +87,19 @@ class GameSession:
         if self.turn != "player" or self.game_ended:
             return {"error": "Not your turn or game ended"}
             
-        if not self.current_puzzle or "clues" not in self.current_puzzle:
+        if not self.current_puzzle or not self.answer_engine:
             return {"error": "No active puzzle"}
             
-        clue = next((c for c in self.current_puzzle["clues"] if c["id"] == clue_id), None)
+        clue = self.answer_engine.get_clue(clue_id)
         if not clue or clue_id in self.answered_clues:
             return {"error": "Invalid clue or already answered"}
             
-        if clue["answer"].upper() == answer.upper():
+        correct, near_miss = self.answer_engine.check_answer(clue_id, answer)
+        if correct:
             self.player_score += clue.get("points", 10)
             self.answered_clues.append(clue_id)
             self.streak += 1
-            self._update_grid(clue, answer.upper())
+            self._update_grid(clue, clue["answer"].upper())
             self.turn = "ai"
             
             # Check win condition
@@ -108,7 +112,7 @@ class GameSession:
             return {"correct": True, "streak": self.streak}
         else:
             self.streak = 0
-            return {"correct": False, "streak": self.streak}
+            return {"correct": False, "near_miss": near_miss, "streak": self.streak}
     
     def _update_grid(self, clue, answer):
         """Update the crossword grid with the answered word"""
@@ -176,14 +180,17 @@ class GameSession:
         if self.hints_used >= 3:  # Limit hints
             return {"error": "No more hints available"}
             
-        if not self.current_puzzle or "clues" not in self.current_puzzle:
+        if not self.current_puzzle or not self.answer_engine:
             return {"error": "No active puzzle"}
             
-        clue = next((c for c in self.current_puzzle["clues"] if c["id"] == clue_id), None)
+        clue = self.answer_engine.get_clue(clue_id)
         if clue and clue_id not in self.answered_clues:
             self.hints_used += 1
-            hint = clue["answer"][:2] + "..." if len(clue["answer"]) > 2 else clue["answer"][0] + "..."
-            return {"hint": hint, "hints_remaining": 3 - self.hints_used}
+            # Each repeat hint on the same clue climbs one rung of the ladder
+            level = self.hint_levels.get(clue_id, 0) + 1
+            self.hint_levels[clue_id] = level
+            hint = self.answer_engine.get_hint(clue_id, level, self.answered_clues)
+            return {"hint": hint, "hint_level": level, "hints_remaining": 3 - self.hints_used}
         return {"error": "Cannot provide hint for this clue"}
     
     def _save_game_stats(self):
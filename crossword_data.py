@@ -1,4 +1,5 @@
 import random
+from answer_engine import AnswerEngine
 
 class CrosswordPuzzleManager:
     """Manages crossword puzzles with different difficulty levels"""
@@ -96,6 +97,14 @@ class CrosswordPuzzleManager:
                 }
             ]
         }
+        
+        # Answer engines are built once per puzzle and shared across sessions.
+        # Keyed by puzzle identity, since titles are display text and may repeat.
+        self.answer_engines = {
+            id(puzzle): AnswerEngine(puzzle)
+            for puzzle_list in self.puzzles.values()
+            for puzzle in puzzle_list
+        }
     
     def get_puzzle(self, difficulty="medium"):
         """Get a random puzzle of specified difficulty"""
@@ -108,6 +117,12 @@ class CrosswordPuzzleManager:
             
         return random.choice(puzzle_list)
     
+    def get_answer_engine(self, puzzle):
+        """Get the precomputed answer engine for a puzzle"""
+        if not puzzle:
+            return None
+        return self.answer_engines.get(id(puzzle))
+    
     def get_all_difficulties(self):
         """Get list of available difficulty levels"""
         return list(self.puzzles.keys())
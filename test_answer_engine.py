@@ -0,0 +1,102 @@
+import pytest
+
+from answer_engine import AnswerEngine
+
+# Small grid whose crossings agree:
+#   C A T
+#   . R E
+#   . T A
+PUZZLE = {
+    "title": "Test Grid",
+    "size": 3,
+    "clues": [
+        {"id": 1, "clue": "Feline pet", "answer": "CAT", "direction": "across", "position": [0, 0], "points": 5},
+        {"id": 2, "clue": "Painting, e.g.", "answer": "ART", "direction": "down", "position": [0, 1], "points": 5},
+        {"id": 3, "clue": "Afternoon drink", "answer": "TEA", "direction": "down", "position": [0, 2], "points": 5},
+        {"id": 4, "clue": "Baked dessert", "answer": "CREMEBRULEE", "points": 10},
+    ],
+}
+
+
+@pytest.fixture
+def engine():
+    return AnswerEngine(PUZZLE)
+
+
+def test_normalize_strips_accents_spaces_and_punctuation():
+    assert AnswerEngine.normalize("Crème brûlée!") == "CREMEBRULEE"
+    assert AnswerEngine.normalize(" c a-t ") == "CAT"
+
+
+def test_check_answer_uses_normalized_keys(engine):
+    assert engine.check_answer(1, "c a t!") == (True, False)
+    assert engine.check_answer(4, "crème-brûlée") == (True, False)
+
+
+def test_near_miss_cost_bound_at_five_and_six_letters():
+    five = AnswerEngine({"clues": [{"id": 1, "answer": "APPLE"}]})
+    assert five.check_answer(1, "APPLX") == (False, True)
+    assert five.check_answer(1, "APXLX") == (False, False)
+
+    six = AnswerEngine({"clues": [{"id": 1, "answer": "BANANA"}]})
+    assert six.check_answer(1, "BANXNX") == (False, True)
+    assert six.check_answer(1, "BXNXNX") == (False, False)
+
+
+def test_adjacent_swap_is_one_edit(engine):
+    assert AnswerEngine._within_distance("AB", "BA", 1)
+    assert engine.check_answer(1, "CTA") == (False, True)
+
+
+def test_crossings_only_link_matching_letters(engine):
+    assert engine.crossings[1] == {2: [1], 3: [2]}
+    assert engine.crossings[2] == {1: [0]}
+
+
+def test_crossings_skip_conflicting_cells():
+    conflicting = AnswerEngine({
+        "title": "Conflict",
+        "clues": [
+            {"id": 1, "answer": "DOG", "direction": "across", "position": [0, 0]},
+            {"id": 2, "answer": "CAT", "direction": "down", "position": [0, 1]},
+        ],
+    })
+    assert conflicting.crossings == {1: {}, 2: {}}
+
+
+def test_hint_ladder_adds_information_each_level(engine):
+    assert engine.get_hint(4, 1) == "CR..."
+    assert engine.get_hint(4, 2) == "CR... (11 letters)"
+    assert engine.get_hint(4, 3) == "CR________E"
+
+
+def test_hint_reveals_letters_from_answered_crossings(engine):
+    assert engine.get_hint(2, 3) == "AR_"
+    assert engine.get_hint(1, 3) == "CA_"
+    assert engine.get_hint(1, 3, answered_clues=[3]) == "CAT"
+    long_clue = AnswerEngine({
+        "clues": [
+            {"id": 1, "answer": "PLANETS", "direction": "across", "position": [0, 0]},
+            {"id": 2, "answer": "NET", "direction": "down", "position": [0, 3]},
+            {"id": 3, "answer": "ATE", "direction": "down", "position": [0, 2]},
+        ],
+    })
+    assert long_clue.get_hint(1, 3) == "PL____S"
+    assert long_clue.get_hint(1, 3, answered_clues=[2]) == "PL_N__S"
+    assert long_clue.get_hint(1, 3, answered_clues=[2, 3]) == "PLAN__S"
+
+
+def test_game_session_hint_levels_advance_per_clue():
+    from app import GameSession, puzzle_manager
+
+    game = GameSession("test-session", "easy")
+    game.start_game()
+    clues = game.current_puzzle["clues"]
+    first, second = clues[0], clues[1]
+
+    assert game.get_hint(first["id"])["hint_level"] == 1
+    assert game.get_hint(first["id"])["hint_level"] == 2
+    result = game.get_hint(second["id"])
+    assert result["hint_level"] == 1
+    assert result["hints_remaining"] == 0
+    assert game.answer_engine is puzzle_manager.get_answer_engine(game.current_puzzle)